@@ -1,8 +1,31 @@
+import csv
+import os
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.compute as pc
+import plotly.graph_objects as go
+import plotly.io as pio
 import warnings
 
+# Serialize figures with orjson when available: plotly's default encoder
+# walks NumPy trace arrays in pure Python, which dominates figure emission
+try:
+    import orjson # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Optional accelerator for large line charts: sends only the points the
+# current viewport needs to the browser. The dashboard works without it.
+try:
+    from plotly_resampler import FigureResampler
+except ImportError:
+    FigureResampler = None
+
 # Suppress warnings related to Plotly versions or similar minor issues
 warnings.filterwarnings('ignore')
 
@@ -10,77 +33,154 @@ warnings.filterwarnings('ignore')
 st.set_page_config(layout="wide", page_title="Sales Performance Dashboard", page_icon="📈")
 
 # --- Data Loading and Preprocessing ---
-@st.cache_data # Cache data to avoid reloading every time the app interacts
+def _build_from_csv():
+    """
+    Reads 'EA.csv' and performs initial data cleaning and feature engineering.
+    This is the slow path; load_data() caches its result as a Parquet sidecar.
+    """
+    # Only the columns the dashboard actually reads; the register carries
+    # many more (GST splits, discounts, descriptions) that would otherwise
+    # be parsed, typed and dragged through every downstream filter
+    used_raw_cols = [
+        'Document No.', 'Posting Date', 'Sell to State', 'Product Group',
+        'Customer Name', 'MRP Category', 'Gender', 'Brands', 'Channel',
+        'Quantity', 'Unit Price', 'Final Line Amount (A-B+C)', 'ASM Name',
+        'Item Category', 'Online Store'
+    ]
+
+    # Sniff the header so the selection tolerates stray whitespace in the
+    # raw CSV column names
+    with open('EA.csv', newline='') as f:
+        header = next(csv.reader(f))
+    by_stripped_name = {name.strip(): name for name in header}
+    include_columns = [by_stripped_name[c] for c in used_raw_cols if c in by_stripped_name]
+
+    # Read the CSV with the PyArrow reader, which parses and type-infers in
+    # parallel C threads; include_columns makes it materialize arrays only
+    # for the selected columns instead of converting then discarding
+    table = pacsv.read_csv(
+        'EA.csv',
+        convert_options=pacsv.ConvertOptions(include_columns=include_columns)
+    )
+
+    # Standardize column names by stripping whitespace
+    table = table.rename_columns([c.strip() for c in table.column_names])
+
+    # Columns that should be numeric, under their raw CSV header names.
+    # Arrow infers most of them as numbers directly; the ones containing
+    # thousands separators arrive as strings and are cleaned below.
+    raw_numeric_cols = ['Quantity', 'Unit Price', 'Final Line Amount (A-B+C)']
+    for col in raw_numeric_cols:
+        # Check if column exists before processing
+        if col not in table.column_names:
+            continue
+        i = table.column_names.index(col)
+        values = table.column(i)
+        if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+            # Strip thousands separators and cast; both run in C over the
+            # Arrow buffers instead of a Python string Series per column
+            cleaned = pc.utf8_trim_whitespace(pc.replace_substring(values, pattern=',', replacement=''))
+            try:
+                values = pc.cast(cleaned, pa.float64())
+            except pa.ArrowInvalid:
+                # Malformed values remain: fall back to pandas' coercing parser
+                values = pa.array(pd.to_numeric(cleaned.to_pandas(), errors='coerce'))
+            table = table.set_column(i, col, values)
+        elif not pa.types.is_floating(values.type):
+            table = table.set_column(i, col, pc.cast(values, pa.float64()))
+
+    df = table.to_pandas()
+
+    # Rename columns for easier access and cleaner visualization labels
+    df = df.rename(columns={
+        'Final Line Amount (A-B+C)': 'Final_Line_Amount',
+        'Posting Date': 'Posting_Date',
+        'Sell to State': 'Region',
+        'Product Group': 'Product_Group',
+        'Customer Name': 'Customer_Name',
+        'MRP Category': 'MRP_Category',
+        'Gender': 'Gender',
+        'Brands': 'Brand',
+        'Channel': 'Sales_Channel',
+        'Quantity': 'Quantity',
+        'Unit Price': 'Unit_Price',
+        'ASM Name': 'ASM_Name',
+        'Item Category': 'Item_Category',
+        'Online Store': 'Online_Store'
+    })
+
+    # Convert 'Posting_Date' to datetime objects, handling various formats
+    # Using dayfirst=True to correctly parse 'DD-MM-YY' or 'DD-MM-YYYY'
+    df['Posting_Date'] = pd.to_datetime(df['Posting_Date'], errors='coerce', dayfirst=True)
+
+    # Drop rows where 'Posting_Date' is NaT (Not a Time) after conversion issues
+    df.dropna(subset=['Posting_Date'], inplace=True)
+
+    # Sort by date once so the sidebar date filter can binary-search its
+    # bounds and take a contiguous slice instead of scanning the column
+    df = df.sort_values('Posting_Date', kind='stable').reset_index(drop=True)
+
+    # Create 'Sale_Over_1000' column based on 'Final_Line_Amount'
+    df['Sale_Over_1000'] = df['Final_Line_Amount'] > 1000
+
+    # Day-of-week and quarter breakdowns are derived on the fly from
+    # Posting_Date inside compute_aggregates; materializing them here as
+    # per-row string columns cost tens of bytes per row for one chart each.
+    # Compact integer month key (yyyymm) so monthly trends can use a plain
+    # groupby instead of set_index + resample on every rerun
+    df['YearMonth'] = (df['Posting_Date'].dt.year * 100 + df['Posting_Date'].dt.month).astype('int32')
+
+    # Numeric columns under their renamed labels (conversion already done on
+    # the Arrow table above)
+    numeric_cols = ['Quantity', 'Unit_Price', 'Final_Line_Amount']
+
+    # Fill NaN in numeric columns with 0 after conversion, as NaNs can break aggregations
+    df[numeric_cols] = df[numeric_cols].fillna(0)
+
+    # Shrink dtypes to cut memory several-fold: downcast float64 to the
+    # smallest type that fits, preferring integers for count-like columns
+    for col in numeric_cols:
+        downcast = 'integer' if col == 'Quantity' else 'float'
+        df[col] = pd.to_numeric(df[col], errors='coerce', downcast=downcast)
+
+    # Convert the low-cardinality text columns to category so groupbys hash
+    # small integer codes instead of Python strings and isin filters scan codes
+    categorical_cols = [
+        'Region', 'Product_Group', 'Customer_Name', 'Brand', 'Sales_Channel',
+        'MRP_Category', 'Gender', 'ASM_Name', 'Item_Category', 'Online_Store'
+    ]
+    for col in categorical_cols:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    return df
+
+@st.cache_resource # cache_data would re-hash the returned frame on every lookup
 def load_data():
     """
-    Loads the sales data from a CSV file named 'EA.csv'.
-    Performs initial data cleaning and feature engineering.
+    Loads the sales data, preferring the 'EA.parquet' sidecar over 'EA.csv'.
+
+    The Parquet file stores the already cleaned and typed frame, so cold
+    starts (cache miss, container restart, code change) skip the CSV parse
+    and the per-column coercion entirely. It is rebuilt whenever 'EA.csv'
+    is newer than the sidecar.
+
+    Cached with st.cache_resource so Streamlit hands back the same frame
+    without hashing it to verify the hit; on a large register that hash
+    dominated the "cached" return time. Nothing downstream mutates the
+    frame: the filters build new objects and tab6 slices copies.
     """
     try:
-        # Read the CSV file directly from the same directory
-        df = pd.read_csv('EA.csv')
-
-        # Standardize column names by stripping whitespace and making them lowercase
-        df.columns = df.columns.str.strip()
-
-        # Rename columns for easier access and cleaner visualization labels
-        df = df.rename(columns={
-            'Final Line Amount (A-B+C)': 'Final_Line_Amount',
-            'Posting Date': 'Posting_Date',
-            'Sell to State': 'Region',
-            'Product Group': 'Product_Group',
-            'Customer Name': 'Customer_Name',
-            'MRP Category': 'MRP_Category',
-            'Gender': 'Gender',
-            'Brands': 'Brand',
-            'Channel': 'Sales_Channel',
-            'Item Description': 'Item_Description',
-            'Sales Article': 'Sales_Article',
-            'Quantity': 'Quantity',
-            'Unit Price': 'Unit_Price',
-            'GL Account Code': 'GL_Account_Code',
-            'Account Name': 'Account_Name',
-            'ASM Name': 'ASM_Name',
-            'Item Category': 'Item_Category',
-            'Product Type': 'Product_Type',
-            'Online Store': 'Online_Store',
-            'Company Name': 'Company_Name'
-        })
-
-        # Convert 'Posting_Date' to datetime objects, handling various formats
-        # Using dayfirst=True to correctly parse 'DD-MM-YY' or 'DD-MM-YYYY'
-        df['Posting_Date'] = pd.to_datetime(df['Posting_Date'], errors='coerce', dayfirst=True)
-
-        # Drop rows where 'Posting_Date' is NaT (Not a Time) after conversion issues
-        df.dropna(subset=['Posting_Date'], inplace=True)
-
-        # Create 'Sale_Over_1000' column based on 'Final_Line_Amount'
-        df['Sale_Over_1000'] = df['Final_Line_Amount'] > 1000
-
-        # Extract Year, Month, Day for time-based analysis
-        df['Year'] = df['Posting_Date'].dt.year
-        df['Month'] = df['Posting_Date'].dt.month_name()
-        df['Day_of_Week'] = df['Posting_Date'].dt.day_name()
-        df['Quarter'] = df['Posting_Date'].dt.quarter.apply(lambda x: f'Q{x}')
-
-        # Ensure numeric types for calculations
-        # List all columns that should be numeric and handle non-numeric values
-        numeric_cols = [
-            'Quantity', 'Unit_Price', 'Line Discount', 'Line Amount (Qty * Unit Unit_Price) -A',
-            'Invoice Discount Amount-B', 'Final_Line_Amount', 'GST Base Amount',
-            'GST Percentage', 'Total GST Amount', 'IGST Amount', 'IGST Per',
-            'SGST Amount', 'SGST Per', 'CGST Amount', 'CGST Per', 'TDS Amount'
-        ]
-        for col in numeric_cols:
-            # Check if column exists before processing
-            if col in df.columns:
-                # Handle commas as thousand separators and convert to numeric
-                df[col] = df[col].astype(str).str.replace(',', '').str.strip()
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        # Fill NaN in numeric columns with 0 after conversion, as NaNs can break aggregations
-        df[numeric_cols] = df[numeric_cols].fillna(0)
-
+        # Reuse the Parquet sidecar if it is at least as fresh as the CSV
+        if os.path.exists('EA.parquet') and os.stat('EA.parquet').st_mtime >= os.stat('EA.csv').st_mtime:
+            return pd.read_parquet('EA.parquet')
+
+        df = _build_from_csv()
+        # Persist the preprocessed frame so the next cold start loads Parquet
+        try:
+            df.to_parquet('EA.parquet', compression='zstd', index=False)
+        except (OSError, ImportError):
+            pass # Read-only filesystem or no Parquet engine; CSV path still works
         return df
     except FileNotFoundError:
         st.error("Error: 'EA.csv' not found. Please make sure the CSV file is in the same directory as 'app.py'.")
@@ -89,6 +189,527 @@ def load_data():
         st.error(f"Error loading or processing data: {e}")
         st.stop() # Stop the app for other data loading/processing errors
 
+@st.cache_data # The full frame is immutable per session; compute once
+def filter_options(_df):
+    """
+    Returns the sorted option lists for the sidebar multiselects.
+
+    Computed from the full frame rather than the progressively filtered one,
+    so reruns skip the per-widget unique() scans; with categorical dtype the
+    category index is already materialized and this is effectively free.
+    """
+    return {
+        col: sorted(_df[col].cat.categories.tolist())
+        for col in ('Region', 'Product_Group', 'Sales_Channel')
+    }
+
+def filter_by_category(frame, col, selected):
+    """
+    Keeps the rows of frame whose col value is in selected.
+
+    Maps the selection to category codes once and runs np.isin over the
+    int code array, instead of hashing a Python string per row the way
+    Series.isin does on the values.
+    """
+    cats = frame[col].cat.categories
+    sel_codes = np.fromiter((cats.get_loc(s) for s in selected if s in cats), dtype=np.intp)
+    mask = np.isin(frame[col].cat.codes.to_numpy(), sel_codes)
+    return frame.iloc[mask]
+
+@st.cache_data # Recompute only when the filter selection changes
+def csv_bytes(_df, date_range, regions, groups, channels, amount_range):
+    """
+    Serializes the filtered frame to CSV bytes for the download button.
+
+    Cached on the filter selection like compute_aggregates(), so reruns
+    that leave the filters untouched reuse the encoded payload instead of
+    re-serializing the whole frame.
+    """
+    return _df.to_csv(index=False).encode()
+
+@st.cache_data # The full frame is immutable per session; compute once
+def amount_bounds(_df):
+    """
+    Global min/max of Final_Line_Amount, used as the slider bounds.
+
+    The bounds come from the unfiltered frame so reruns skip the two
+    full-column reductions the slider used to trigger on every interaction.
+    """
+    return float(_df['Final_Line_Amount'].min()), float(_df['Final_Line_Amount'].max())
+
+def category_sum(col, weights):
+    """
+    Sums weights per category of a categorical Series via np.add.at.
+
+    A single C accumulate pass over the int code array replaces a groupby
+    hash-table build, and every chart that calls this reuses the same
+    materialized amount array. Rows without a category (code -1) fold into
+    a scratch slot at the end and are discarded; categories with no rows
+    are dropped to match an observed groupby.
+    """
+    codes = col.cat.codes.to_numpy()
+    n = len(col.cat.categories)
+    out = np.zeros(n + 1)
+    np.add.at(out, codes, weights) # code -1 lands in the scratch slot
+    present = np.bincount(codes + 1, minlength=n + 1)[1:] > 0
+    result = pd.DataFrame({col.name: col.cat.categories, 'Final_Line_Amount': out[:n]})
+    return result[present].reset_index(drop=True)
+
+@st.cache_data # Recompute only when the filter selection changes
+def compute_aggregates(_df, date_range, regions, groups, channels, amount_range):
+    """
+    Computes every per-tab aggregate over the filtered frame in one place.
+
+    Streamlit reruns the whole script on any widget change; without this,
+    all twenty groupbys would run back-to-back on every rerun. The frame
+    itself is excluded from the cache key (leading underscore) and the
+    filter selection keys the cache instead, so only filter changes pay
+    the aggregation cost.
+    """
+    agg = {}
+
+    # Materialized once and shared by the metrics, the two-bucket
+    # breakdowns and the calendar bincounts below
+    amount = _df['Final_Line_Amount'].to_numpy()
+    flag = _df['Sale_Over_1000'].to_numpy().view(np.uint8)
+
+    # The threshold flag has only two values, so two bincount calls give
+    # the counts and the revenue split in two C loops with no hash table
+    threshold_counts = np.bincount(flag, minlength=2)
+    threshold_revenue = np.bincount(flag, weights=amount, minlength=2)
+
+    # Tab 1: key metrics and overview charts
+    agg['total_sales'] = amount.sum()
+    agg['total_transactions'] = _df['Document No.'].nunique()
+    agg['sales_over_1000'] = int(threshold_counts[1])
+    # One pass over Product_Group serves charts 1, 6 and 7: a single fused
+    # .agg hashes the key column once instead of three separate groupbys
+    pg = _df.groupby('Product_Group', observed=True, sort=False).agg(
+        Final_Line_Amount=('Final_Line_Amount', 'sum'),
+        Quantity=('Quantity', 'sum'),
+        Unit_Price=('Unit_Price', 'mean')
+    )
+    agg['product_sales'] = pg['Final_Line_Amount'].nlargest(10).reset_index()
+    agg['region_sales'] = category_sum(_df['Region'], amount)
+
+    # Tab 2: sales deep dive
+    agg['channel_sales'] = category_sum(_df['Sales_Channel'], amount)
+    agg['top_customers'] = category_sum(_df['Customer_Name'], amount).nlargest(15, 'Final_Line_Amount').reset_index(drop=True)
+    agg['mrp_sales'] = category_sum(_df['MRP_Category'], amount)
+    agg['qty_product_sales'] = pg['Quantity'].nlargest(10).reset_index()
+    agg['avg_price_product'] = pg['Unit_Price'].sort_index().reset_index()
+
+    # Tab 3: above/below $1000 breakdowns, built from the bincount results
+    agg['amount_category_counts'] = pd.DataFrame({
+        'Category': ['Sales <= $1000', 'Sales > $1000'],
+        'Count': threshold_counts
+    })
+    agg['revenue_by_category'] = pd.DataFrame({
+        'Sale_Over_1000': ['Revenue from Sales <= $1000', 'Revenue from Sales > $1000'],
+        'Final_Line_Amount': threshold_revenue
+    })
+
+    # Masked sum instead of materializing a row-subset copy: amounts from
+    # sales at or below $1000 contribute 0, so no boolean-gather is needed.
+    # Amounts above $1000 cannot sum to 0, so dropping zero groups restores
+    # the groups the filtered frame would have had.
+    hv_amount = np.where(flag == 1, amount, 0.0)
+    hv_region = category_sum(_df['Region'], hv_amount)
+    agg['high_value_region_sales'] = hv_region[hv_region['Final_Line_Amount'] > 0]
+    hv_product = category_sum(_df['Product_Group'], hv_amount).nlargest(10, 'Final_Line_Amount')
+    agg['high_value_product_sales'] = hv_product[hv_product['Final_Line_Amount'] > 0].reset_index(drop=True)
+
+    # Tab 4: time trends
+    # Group on the precomputed integer month key; one fused pass replaces
+    # the two set_index + resample('M') runs and their index copies
+    monthly = _df.groupby('YearMonth', sort=True).agg(
+        Final_Line_Amount=('Final_Line_Amount', 'sum'),
+        Quantity=('Quantity', 'sum')
+    ).reset_index()
+    monthly['Posting_Date'] = pd.to_datetime(monthly['YearMonth'], format='%Y%m')
+    agg['monthly_sales'] = monthly[['Posting_Date', 'Final_Line_Amount']]
+    agg['monthly_qty'] = monthly[['Posting_Date', 'Quantity']]
+
+    # Quarter and day-of-week totals come straight from Posting_Date via
+    # np.bincount on the small int codes: one C pass each, no groupby hash
+    # table and no per-row string columns
+    quarter = _df['Posting_Date'].dt.quarter.to_numpy()
+    quarter_sums = np.bincount(quarter, weights=amount, minlength=5)
+    quarter_present = np.bincount(quarter, minlength=5)[1:] > 0
+    agg['quarterly_sales'] = pd.DataFrame({
+        'Quarter': ['Q1', 'Q2', 'Q3', 'Q4'],
+        'Final_Line_Amount': quarter_sums[1:]
+    })[quarter_present]
+
+    day_of_week_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    dow = _df['Posting_Date'].dt.dayofweek.to_numpy()
+    dow_sums = np.bincount(dow, weights=amount, minlength=7)
+    dow_present = np.bincount(dow, minlength=7) > 0
+    agg['daily_sales'] = pd.DataFrame({
+        'Day_of_Week': day_of_week_order,
+        'Final_Line_Amount': np.where(dow_present, dow_sums, np.nan)
+    })
+
+    # Tab 5: customer and product insights
+    agg['gender_sales'] = category_sum(_df['Gender'], amount)
+    agg['brand_sales'] = category_sum(_df['Brand'], amount).nlargest(10, 'Final_Line_Amount').reset_index(drop=True)
+    agg['asm_sales'] = category_sum(_df['ASM_Name'], amount).nlargest(10, 'Final_Line_Amount').reset_index(drop=True)
+    agg['item_category_sales'] = category_sum(_df['Item_Category'], amount)
+    if 'Online_Store' in _df.columns and not _df['Online_Store'].isnull().all():
+        agg['online_store_sales'] = category_sum(_df['Online_Store'], amount)
+    else:
+        agg['online_store_sales'] = None
+
+    return agg
+
+# --- Chart Helpers ---
+# plotly.express spends most of its figure-build time wrangling the input
+# dataframe; for the tiny aggregated frames plotted here, constructing the
+# graph_objects trace directly is several times faster per chart.
+def bar_chart(x, y, title, x_label, y_label, colorscale='Plasma'):
+    """Builds a bar chart colored by its y values, like px.bar with a
+    continuous color scale."""
+    # A typed array lets the JSON encoder take its array fast path instead
+    # of encoding element by element
+    y = np.asarray(y, dtype=np.float32)
+    fig = go.Figure(go.Bar(x=x, y=y, marker=dict(color=y, colorscale=colorscale)))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label,
+                      margin=dict(l=40, r=10, t=40, b=40))
+    return fig
+
+def pie_chart(values, names, title, hole=0.3):
+    """Builds a donut chart, like px.pie with a hole."""
+    fig = go.Figure(go.Pie(labels=names, values=values, hole=hole))
+    fig.update_layout(title=title, margin=dict(l=40, r=10, t=40, b=40))
+    return fig
+
+def line_chart(x, y, title, x_label, y_label):
+    """
+    Builds a line chart, like px.line, using a WebGL trace.
+
+    When plotly-resampler is installed and the series outgrows what a
+    browser renders comfortably, the figure is wrapped so only the points
+    the current viewport needs are shipped; monthly aggregates stay small
+    enough to be sent as-is.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float32)
+    if FigureResampler is not None and len(x) > 1000:
+        fig = FigureResampler(go.Figure())
+        fig.add_trace(go.Scattergl(mode='lines'), hf_x=x, hf_y=y)
+    else:
+        fig = go.Figure(go.Scattergl(x=x, y=y, mode='lines'))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label,
+                      margin=dict(l=40, r=10, t=40, b=40))
+    return fig
+
+# --- Tab Renderers ---
+# Each view body lives in its own function so the dispatch below can build
+# only the page the user is looking at.
+def render_overview(agg):
+    """Overview tab: key metrics plus the product-group and region charts."""
+    st.header("Overview: Key Sales Metrics")
+
+    # Row 1: Key Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown("### Total Sales Revenue")
+        total_sales = agg['total_sales']
+        st.metric(label="Total Sales", value=f"${total_sales:,.2f}")
+        st.markdown("This metric represents the sum of all final line amounts, giving a grand total of sales revenue generated within the selected filters.")
+    with col2:
+        st.markdown("### Total Transactions")
+        # Using 'Document No.' assuming it's the unique identifier for a transaction
+        total_transactions = agg['total_transactions']
+        st.metric(label="Total Transactions", value=f"{total_transactions:,}")
+        st.markdown("This shows the total count of unique sales documents, indicating the volume of sales activities.")
+    with col3:
+        st.markdown("### Sales Above $1000")
+        sales_over_1000 = agg['sales_over_1000']
+        st.metric(label="Transactions > $1000", value=f"{sales_over_1000:,}")
+        st.markdown("This highlights the number of individual sales transactions where the final amount exceeded $1000, identifying high-value deals.")
+    with col4:
+        st.markdown("### % Sales Above $1000")
+        percentage_over_1000 = (sales_over_1000 / total_transactions * 100) if total_transactions > 0 else 0
+        st.metric(label="% of Transactions > $1000", value=f"{percentage_over_1000:,.2f}%")
+        st.markdown("This percentage indicates the proportion of high-value sales relative to all transactions, useful for understanding sales quality.")
+
+    st.markdown("---")
+
+    # Chart 1: Sales Distribution by Product Group (Top 10)
+    st.markdown("### Sales Distribution by Product Group")
+    st.markdown("This bar chart illustrates the total sales revenue generated by each product group. It helps in identifying which product categories are the most profitable.")
+    product_sales = agg['product_sales']
+    if not product_sales.empty:
+        fig1 = bar_chart(product_sales['Product_Group'], product_sales['Final_Line_Amount'],
+                         title='Top 10 Product Group Sales',
+                         x_label='Product Group', y_label='Total Sales Amount', colorscale='Plasma')
+        st.plotly_chart(fig1, use_container_width=True)
+    else:
+        st.info("No data for Product Group Sales.")
+
+    # Chart 2: Sales Distribution by Region
+    st.markdown("### Sales Distribution by Region")
+    st.markdown("This pie chart visualizes the proportion of total sales contributed by each geographical region. It helps in understanding regional sales performance at a glance.")
+    region_sales = agg['region_sales']
+    if not region_sales.empty:
+        fig2 = pie_chart(region_sales['Final_Line_Amount'], region_sales['Region'],
+                         title='Sales Distribution by Region')
+        st.plotly_chart(fig2, use_container_width=True)
+    else:
+        st.info("No data for Sales Distribution by Region.")
+
+def render_sales_analysis(agg):
+    """Sales Analysis tab: channel, customer, MRP and product-group charts."""
+    st.header("Sales Analysis: Deep Dive")
+
+    # Chart 3: Sales by Sales Channel
+    st.markdown("### Sales by Sales Channel")
+    st.markdown("This bar chart breaks down sales by the channel through which they were made (e.g., Distributor, Online). It helps in assessing the effectiveness of different sales strategies.")
+    channel_sales = agg['channel_sales']
+    if not channel_sales.empty:
+        fig3 = bar_chart(channel_sales['Sales_Channel'], channel_sales['Final_Line_Amount'],
+                         title='Sales by Sales Channel',
+                         x_label='Sales Channel', y_label='Total Sales Amount', colorscale='Viridis')
+        st.plotly_chart(fig3, use_container_width=True)
+    else:
+        st.info("No data for Sales by Sales Channel.")
+
+    # Chart 4: Sales by Customer Name (Top N)
+    st.markdown("### Top 15 Customers by Sales Amount")
+    st.markdown("This chart identifies the top customers based on their total purchase amounts. It's crucial for understanding key accounts and customer loyalty.")
+    top_customers = agg['top_customers']
+    if not top_customers.empty:
+        fig4 = bar_chart(top_customers['Customer_Name'], top_customers['Final_Line_Amount'],
+                         title='Top 15 Customers by Sales Amount',
+                         x_label='Customer Name', y_label='Total Sales Amount', colorscale='Mint')
+        st.plotly_chart(fig4, use_container_width=True)
+    else:
+        st.info("No data for Top Customers by Sales Amount.")
+
+    # Chart 5: Sales by MRP Category
+    st.markdown("### Sales by MRP Category")
+    st.markdown("This visualization categorizes sales by their MRP (Maximum Retail Price) groups, offering insights into which price segments perform best.")
+    mrp_sales = agg['mrp_sales']
+    if not mrp_sales.empty:
+        fig5 = bar_chart(mrp_sales['MRP_Category'], mrp_sales['Final_Line_Amount'],
+                         title='Sales by MRP Category',
+                         x_label='MRP Category', y_label='Total Sales Amount', colorscale='Sunset')
+        st.plotly_chart(fig5, use_container_width=True)
+    else:
+        st.info("No data for Sales by MRP Category.")
+
+    # Chart 6: Quantity Sold by Product Group
+    st.markdown("### Quantity Sold by Product Group")
+    st.markdown("This bar chart shows the total quantity of items sold within each product group, complementing the sales revenue data for a complete picture of performance.")
+    qty_product_sales = agg['qty_product_sales']
+    if not qty_product_sales.empty:
+        fig6 = bar_chart(qty_product_sales['Product_Group'], qty_product_sales['Quantity'],
+                         title='Top 10 Product Group by Quantity Sold',
+                         x_label='Product Group', y_label='Total Quantity Sold', colorscale='Plasma')
+        st.plotly_chart(fig6, use_container_width=True)
+    else:
+        st.info("No data for Quantity Sold by Product Group.")
+    
+    # Chart 7: Average Unit Price by Product Group
+    st.markdown("### Average Unit Price by Product Group")
+    st.markdown("This chart shows the average unit price for items in each product group, which can indicate pricing strategies or product value.")
+    avg_price_product = agg['avg_price_product']
+    if not avg_price_product.empty:
+        fig7 = bar_chart(avg_price_product['Product_Group'], avg_price_product['Unit_Price'],
+                         title='Average Unit Price by Product Group',
+                         x_label='Product Group', y_label='Average Unit Price', colorscale='Greens')
+        st.plotly_chart(fig7, use_container_width=True)
+    else:
+        st.info("No data for Average Unit Price by Product Group.")
+
+def render_amount_analysis(agg):
+    """Amount > $1000 tab: threshold distribution and high-value breakdowns."""
+    st.header("Amount > $1000 Analysis")
+
+    # Chart 8: Sales Above/Below $1000 Distribution
+    st.markdown("### Distribution of Sales by Amount Threshold ($1000)")
+    st.markdown("This pie chart illustrates the proportion of transactions that are above or below the $1000 threshold. It helps HR and stakeholders understand the volume of high-value versus regular transactions.")
+    amount_category_counts = agg['amount_category_counts']
+    if not amount_category_counts.empty:
+        fig8 = pie_chart(amount_category_counts['Count'], amount_category_counts['Category'],
+                         title='Number of Sales Transactions Above/Below $1000')
+        st.plotly_chart(fig8, use_container_width=True)
+    else:
+        st.info("No data for Sales Above/Below $1000 Distribution.")
+
+    # Chart 9: Total Revenue from Sales Above/Below $1000
+    st.markdown("### Revenue Contribution by Sales Amount Threshold ($1000)")
+    st.markdown("This bar chart shows the total revenue generated from sales above $1000 compared to sales below or equal to $1000. It highlights the significant financial impact of high-value sales.")
+    revenue_by_category = agg['revenue_by_category']
+    if not revenue_by_category.empty:
+        fig9 = bar_chart(revenue_by_category['Sale_Over_1000'], revenue_by_category['Final_Line_Amount'],
+                         title='Total Revenue from Sales Above/Below $1000',
+                         x_label='Sale Category', y_label='Total Revenue', colorscale='Blues')
+        st.plotly_chart(fig9, use_container_width=True)
+    else:
+        st.info("No data for Revenue Contribution by Sales Amount Threshold.")
+    
+    # Chart 10: Sales > $1000 by Region
+    st.markdown("### High-Value Sales (> $1000) by Region")
+    st.markdown("This chart focuses specifically on high-value transactions and breaks them down by region. This helps identify regions that are strong contributors to premium sales.")
+    high_value_region_sales = agg['high_value_region_sales']
+    if not high_value_region_sales.empty:
+        fig10 = bar_chart(high_value_region_sales['Region'], high_value_region_sales['Final_Line_Amount'],
+                          title='High-Value Sales (> $1000) by Region',
+                          x_label='Region', y_label='Total High-Value Sales', colorscale='Oranges')
+        st.plotly_chart(fig10, use_container_width=True)
+    else:
+        st.info("No data for High-Value Sales by Region.")
+
+    # Chart 11: Sales > $1000 by Product Group
+    st.markdown("### High-Value Sales (> $1000) by Product Group")
+    st.markdown("This chart shows which product groups are driving the most high-value sales. This information is critical for product development and marketing strategies.")
+    high_value_product_sales = agg['high_value_product_sales']
+    if not high_value_product_sales.empty:
+        fig11 = bar_chart(high_value_product_sales['Product_Group'], high_value_product_sales['Final_Line_Amount'],
+                          title='Top 10 Product Group High-Value Sales (> $1000)',
+                          x_label='Product Group', y_label='Total High-Value Sales', colorscale='Greys')
+        st.plotly_chart(fig11, use_container_width=True)
+    else:
+        st.info("No data for High-Value Sales by Product Group.")
+
+def render_trend_analysis(agg):
+    """Trend Analysis tab: monthly, quarterly and weekday trends."""
+    st.header("Trend Analysis")
+
+    # Chart 12: Monthly Sales Trend
+    st.markdown("### Monthly Sales Trend")
+    st.markdown("This line chart visualizes the total sales amount over months. It helps identify seasonal patterns or overall growth/decline trends in sales performance.")
+    monthly_sales = agg['monthly_sales']
+    if not monthly_sales.empty:
+        fig12 = line_chart(monthly_sales['Posting_Date'], monthly_sales['Final_Line_Amount'],
+                           title='Monthly Sales Trend',
+                           x_label='Date', y_label='Total Sales Amount')
+        st.plotly_chart(fig12, use_container_width=True)
+    else:
+        st.info("No data for Monthly Sales Trend.")
+
+    # Chart 13: Quarterly Sales Trend
+    st.markdown("### Quarterly Sales Trend")
+    st.markdown("This bar chart displays sales aggregated by quarter. It provides a broader view of sales cycles, which is useful for long-term planning and resource allocation.")
+    quarterly_sales = agg['quarterly_sales']
+    if not quarterly_sales.empty:
+        fig13 = bar_chart(quarterly_sales['Quarter'], quarterly_sales['Final_Line_Amount'],
+                          title='Quarterly Sales Trend',
+                          x_label='Quarter', y_label='Total Sales Amount', colorscale='Teal')
+        st.plotly_chart(fig13, use_container_width=True)
+    else:
+        st.info("No data for Quarterly Sales Trend.")
+
+    # Chart 14: Sales by Day of Week
+    st.markdown("### Sales by Day of Week")
+    st.markdown("This chart reveals sales performance across different days of the week, indicating peak selling days or periods of lower activity for operational adjustments.")
+    daily_sales = agg['daily_sales']
+    if not daily_sales.empty:
+        fig14 = bar_chart(daily_sales['Day_of_Week'], daily_sales['Final_Line_Amount'],
+                          title='Sales by Day of Week',
+                          x_label='Day of Week', y_label='Total Sales Amount', colorscale='Magenta')
+        st.plotly_chart(fig14, use_container_width=True)
+    else:
+        st.info("No data for Sales by Day of Week.")
+
+    # Chart 15: Monthly Quantity Sold Trend
+    st.markdown("### Monthly Quantity Sold Trend")
+    st.markdown("Similar to the monthly sales trend, this graph tracks the quantity of items sold each month, helping to understand inventory movement and demand fluctuations.")
+    monthly_qty = agg['monthly_qty']
+    if not monthly_qty.empty:
+        fig15 = line_chart(monthly_qty['Posting_Date'], monthly_qty['Quantity'],
+                           title='Monthly Quantity Sold Trend',
+                           x_label='Date', y_label='Total Quantity Sold')
+        st.plotly_chart(fig15, use_container_width=True)
+    else:
+        st.info("No data for Monthly Quantity Sold Trend.")
+
+def render_customer_product_insights(agg):
+    """Customer & Product Insights tab: gender, brand, ASM and category charts."""
+    st.header("Customer & Product Insights")
+
+    # Chart 16: Sales by Gender
+    st.markdown("### Sales by Gender")
+    st.markdown("This chart breaks down sales figures based on customer gender, which can inform targeted marketing campaigns and product development.")
+    gender_sales = agg['gender_sales']
+    if not gender_sales.empty:
+        fig16 = bar_chart(gender_sales['Gender'], gender_sales['Final_Line_Amount'],
+                          title='Sales by Gender',
+                          x_label='Gender', y_label='Total Sales Amount', colorscale='Portland')
+        st.plotly_chart(fig16, use_container_width=True)
+    else:
+        st.info("No data for Sales by Gender.")
+
+    # Chart 17: Sales by Brand (Top 10)
+    st.markdown("### Top 10 Brands by Sales")
+    st.markdown("This bar chart highlights the brands that contribute the most to total sales revenue, identifying top-performing brands in the portfolio.")
+    brand_sales = agg['brand_sales']
+    if not brand_sales.empty:
+        fig17 = bar_chart(brand_sales['Brand'], brand_sales['Final_Line_Amount'],
+                          title='Top 10 Brands by Sales',
+                          x_label='Brand', y_label='Total Sales Amount', colorscale='Rainbow')
+        st.plotly_chart(fig17, use_container_width=True)
+    else:
+        st.info("No data for Top 10 Brands by Sales.")
+    
+    # Chart 18: Sales by ASM Name (Top 10 Sales Representatives)
+    st.markdown("### Sales Performance by Sales Area Manager (ASM)")
+    st.markdown("This chart displays the sales contribution of each ASM (Area Sales Manager). It's useful for evaluating individual performance and identifying top sales personnel.")
+    asm_sales = agg['asm_sales']
+    if not asm_sales.empty:
+        fig18 = bar_chart(asm_sales['ASM_Name'], asm_sales['Final_Line_Amount'],
+                          title='Top 10 Sales by ASM Name',
+                          x_label='ASM Name', y_label='Total Sales Amount', colorscale='Cividis')
+        st.plotly_chart(fig18, use_container_width=True)
+    else:
+        st.info("No data for Sales Performance by ASM Name.")
+
+    # Chart 19: Sales by Item Category
+    st.markdown("### Sales by Item Category")
+    st.markdown("This visualization shows the distribution of sales across different item categories. It helps in understanding which product types are most popular.")
+    item_category_sales = agg['item_category_sales']
+    if not item_category_sales.empty:
+        fig19 = bar_chart(item_category_sales['Item_Category'], item_category_sales['Final_Line_Amount'],
+                          title='Sales by Item Category',
+                          x_label='Item Category', y_label='Total Sales Amount', colorscale='Inferno')
+        st.plotly_chart(fig19, use_container_width=True)
+    else:
+        st.info("No data for Sales by Item Category.")
+
+    # Chart 20: Sales by Online Store (if applicable)
+    if agg['online_store_sales'] is not None:
+        st.markdown("### Sales by Online/Offline Store")
+        st.markdown("This chart compares sales generated through online platforms versus offline stores. It helps in evaluating the performance of different sales channels.")
+        online_store_sales = agg['online_store_sales']
+        if not online_store_sales.empty:
+            fig20 = pie_chart(online_store_sales['Final_Line_Amount'], online_store_sales['Online_Store'],
+                              title='Sales by Online/Offline Store')
+            st.plotly_chart(fig20, use_container_width=True)
+        else:
+            st.info("No data for Sales by Online/Offline Store.")
+    else:
+        st.info("Online_Store data not available or all null for visualization.")
+
+def render_detailed_data(filtered_df, download_payload):
+    """Detailed Data tab: paginated table plus a CSV download of the full slice."""
+    st.header("Detailed Data View")
+    st.markdown("This table provides a raw view of the filtered sales data, allowing for detailed inspection of individual transactions. You can sort and search within this table.")
+    # Paginate instead of serializing the whole filtered frame to the
+    # browser on every rerun; the download button covers the full slice
+    page_size = 500
+    total_pages = max(1, (len(filtered_df) - 1) // page_size + 1)
+    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
+    st.caption(f"Showing rows {(page - 1) * page_size + 1:,}-{min(page * page_size, len(filtered_df)):,} of {len(filtered_df):,}")
+    st.dataframe(filtered_df.iloc[(page - 1) * page_size:page * page_size])
+    st.download_button(
+        "Download filtered data as CSV",
+        download_payload,
+        file_name='filtered_sales.csv',
+        mime='text/csv'
+    )
+
 # Load data at the beginning of the script
 df = load_data()
 
@@ -107,35 +728,46 @@ if not df.empty:
         max_value=max_date
     )
 
-    # Apply date filter
+    # Apply date filter. The frame is sorted by Posting_Date on load, so the
+    # selected range maps to a contiguous slice found by binary search in
+    # O(log N) rather than two full-column comparisons plus a gather
     if len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_df = df[(df['Posting_Date'] >= pd.to_datetime(start_date)) & (df['Posting_Date'] <= pd.to_datetime(end_date))]
+        dates = df['Posting_Date'].to_numpy()
+        lo = dates.searchsorted(np.datetime64(pd.to_datetime(start_date)), side='left')
+        hi = dates.searchsorted(np.datetime64(pd.to_datetime(end_date)), side='right')
+        filtered_df = df.iloc[lo:hi]
     else:
         filtered_df = df.copy() # If date range is not fully selected, use full data initially
 
     # Other filters (ensure they are only created if filtered_df is not empty)
     if not filtered_df.empty:
-        all_regions = ['All'] + sorted(filtered_df['Region'].dropna().unique().tolist())
+        # Option lists come from the cached full-frame categories, so no
+        # unique() scan of the filtered frame runs on reruns
+        options = filter_options(df)
+
+        all_regions = ['All'] + options['Region']
         selected_regions = st.sidebar.multiselect("Select Region(s)", all_regions, default='All')
         if 'All' not in selected_regions:
-            filtered_df = filtered_df[filtered_df['Region'].isin(selected_regions)]
+            filtered_df = filter_by_category(filtered_df, 'Region', selected_regions)
 
-        all_product_groups = ['All'] + sorted(filtered_df['Product_Group'].dropna().unique().tolist())
+        all_product_groups = ['All'] + options['Product_Group']
         selected_product_groups = st.sidebar.multiselect("Select Product Group(s)", all_product_groups, default='All')
         if 'All' not in selected_product_groups:
-            filtered_df = filtered_df[filtered_df['Product_Group'].isin(selected_product_groups)]
+            filtered_df = filter_by_category(filtered_df, 'Product_Group', selected_product_groups)
 
-        all_sales_channels = ['All'] + sorted(filtered_df['Sales_Channel'].dropna().unique().tolist())
+        all_sales_channels = ['All'] + options['Sales_Channel']
         selected_sales_channels = st.sidebar.multiselect("Select Sales Channel(s)", all_sales_channels, default='All')
         if 'All' not in selected_sales_channels:
-            filtered_df = filtered_df[filtered_df['Sales_Channel'].isin(selected_sales_channels)]
+            filtered_df = filter_by_category(filtered_df, 'Sales_Channel', selected_sales_channels)
 
         # Dynamic slider for Final Line Amount (A-B+C)
         # Check if 'Final_Line_Amount' is present and not all NaN before creating slider
+        amount_range = None
         if 'Final_Line_Amount' in filtered_df.columns and not filtered_df['Final_Line_Amount'].empty:
-            min_amount = float(filtered_df['Final_Line_Amount'].min())
-            max_amount = float(filtered_df['Final_Line_Amount'].max())
+            # Cached global bounds; the slider does not need to snap to the
+            # filtered subset, so no per-rerun min/max scan is needed
+            min_amount, max_amount = amount_bounds(df)
             amount_range = st.sidebar.slider(
                 "Filter by Final Line Amount",
                 min_value=min_amount,
@@ -157,323 +789,35 @@ st.markdown("This dashboard provides a comprehensive view of sales data, offerin
 if filtered_df.empty:
     st.info("No data available based on current filters. Please adjust your selections or check the 'EA.csv' file.")
 else:
-    # --- Tabs for navigation ---
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["Overview", "Sales Analysis", "Amount > 1000 Analysis", "Trend Analysis", "Customer & Product Insights", "Detailed Data"])
-
-    with tab1:
-        st.header("Overview: Key Sales Metrics")
-
-        # Row 1: Key Metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown("### Total Sales Revenue")
-            total_sales = filtered_df['Final_Line_Amount'].sum()
-            st.metric(label="Total Sales", value=f"${total_sales:,.2f}")
-            st.markdown("This metric represents the sum of all final line amounts, giving a grand total of sales revenue generated within the selected filters.")
-        with col2:
-            st.markdown("### Total Transactions")
-            # Using 'Document No.' assuming it's the unique identifier for a transaction
-            total_transactions = filtered_df['Document No.'].nunique()
-            st.metric(label="Total Transactions", value=f"{total_transactions:,}")
-            st.markdown("This shows the total count of unique sales documents, indicating the volume of sales activities.")
-        with col3:
-            st.markdown("### Sales Above $1000")
-            sales_over_1000 = filtered_df[filtered_df['Sale_Over_1000']].shape[0]
-            st.metric(label="Transactions > $1000", value=f"{sales_over_1000:,}")
-            st.markdown("This highlights the number of individual sales transactions where the final amount exceeded $1000, identifying high-value deals.")
-        with col4:
-            st.markdown("### % Sales Above $1000")
-            percentage_over_1000 = (sales_over_1000 / total_transactions * 100) if total_transactions > 0 else 0
-            st.metric(label="% of Transactions > $1000", value=f"{percentage_over_1000:,.2f}%")
-            st.markdown("This percentage indicates the proportion of high-value sales relative to all transactions, useful for understanding sales quality.")
-
-        st.markdown("---")
-
-        # Chart 1: Sales Distribution by Product Group (Top 10)
-        st.markdown("### Sales Distribution by Product Group")
-        st.markdown("This bar chart illustrates the total sales revenue generated by each product group. It helps in identifying which product categories are the most profitable.")
-        product_sales = filtered_df.groupby('Product_Group')['Final_Line_Amount'].sum().nlargest(10).reset_index()
-        if not product_sales.empty:
-            fig1 = px.bar(product_sales, x='Product_Group', y='Final_Line_Amount',
-                          title='Top 10 Product Group Sales',
-                          labels={'Product_Group': 'Product Group', 'Final_Line_Amount': 'Total Sales Amount'},
-                          color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Plasma)
-            st.plotly_chart(fig1, use_container_width=True)
-        else:
-            st.info("No data for Product Group Sales.")
-
-        # Chart 2: Sales Distribution by Region
-        st.markdown("### Sales Distribution by Region")
-        st.markdown("This pie chart visualizes the proportion of total sales contributed by each geographical region. It helps in understanding regional sales performance at a glance.")
-        region_sales = filtered_df.groupby('Region')['Final_Line_Amount'].sum().reset_index()
-        if not region_sales.empty:
-            fig2 = px.pie(region_sales, values='Final_Line_Amount', names='Region',
-                          title='Sales Distribution by Region',
-                          hole=0.3,
-                          labels={'Final_Line_Amount': 'Total Sales Amount'})
-            st.plotly_chart(fig2, use_container_width=True)
-        else:
-            st.info("No data for Sales Distribution by Region.")
-
-
-    with tab2:
-        st.header("Sales Analysis: Deep Dive")
-
-        # Chart 3: Sales by Sales Channel
-        st.markdown("### Sales by Sales Channel")
-        st.markdown("This bar chart breaks down sales by the channel through which they were made (e.g., Distributor, Online). It helps in assessing the effectiveness of different sales strategies.")
-        channel_sales = filtered_df.groupby('Sales_Channel')['Final_Line_Amount'].sum().reset_index()
-        if not channel_sales.empty:
-            fig3 = px.bar(channel_sales, x='Sales_Channel', y='Final_Line_Amount',
-                          title='Sales by Sales Channel',
-                          labels={'Sales_Channel': 'Sales Channel', 'Final_Line_Amount': 'Total Sales Amount'},
-                          color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Viridis)
-            st.plotly_chart(fig3, use_container_width=True)
-        else:
-            st.info("No data for Sales by Sales Channel.")
-
-        # Chart 4: Sales by Customer Name (Top N)
-        st.markdown("### Top 15 Customers by Sales Amount")
-        st.markdown("This chart identifies the top customers based on their total purchase amounts. It's crucial for understanding key accounts and customer loyalty.")
-        top_customers = filtered_df.groupby('Customer_Name')['Final_Line_Amount'].sum().nlargest(15).reset_index()
-        if not top_customers.empty:
-            fig4 = px.bar(top_customers, x='Customer_Name', y='Final_Line_Amount',
-                          title='Top 15 Customers by Sales Amount',
-                          labels={'Customer_Name': 'Customer Name', 'Final_Line_Amount': 'Total Sales Amount'},
-                          color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Mint)
-            st.plotly_chart(fig4, use_container_width=True)
-        else:
-            st.info("No data for Top Customers by Sales Amount.")
-
-        # Chart 5: Sales by MRP Category
-        st.markdown("### Sales by MRP Category")
-        st.markdown("This visualization categorizes sales by their MRP (Maximum Retail Price) groups, offering insights into which price segments perform best.")
-        mrp_sales = filtered_df.groupby('MRP_Category')['Final_Line_Amount'].sum().reset_index()
-        if not mrp_sales.empty:
-            fig5 = px.bar(mrp_sales, x='MRP_Category', y='Final_Line_Amount',
-                          title='Sales by MRP Category',
-                          labels={'MRP_Category': 'MRP Category', 'Final_Line_Amount': 'Total Sales Amount'},
-                          color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Sunset)
-            st.plotly_chart(fig5, use_container_width=True)
-        else:
-            st.info("No data for Sales by MRP Category.")
-
-        # Chart 6: Quantity Sold by Product Group
-        st.markdown("### Quantity Sold by Product Group")
-        st.markdown("This bar chart shows the total quantity of items sold within each product group, complementing the sales revenue data for a complete picture of performance.")
-        qty_product_sales = filtered_df.groupby('Product_Group')['Quantity'].sum().nlargest(10).reset_index()
-        if not qty_product_sales.empty:
-            fig6 = px.bar(qty_product_sales, x='Product_Group', y='Quantity',
-                          title='Top 10 Product Group by Quantity Sold',
-                          labels={'Product_Group': 'Product Group', 'Quantity': 'Total Quantity Sold'},
-                          color='Quantity', color_continuous_scale=px.colors.sequential.Plasma)
-            st.plotly_chart(fig6, use_container_width=True)
-        else:
-            st.info("No data for Quantity Sold by Product Group.")
-        
-        # Chart 7: Average Unit Price by Product Group
-        st.markdown("### Average Unit Price by Product Group")
-        st.markdown("This chart shows the average unit price for items in each product group, which can indicate pricing strategies or product value.")
-        avg_price_product = filtered_df.groupby('Product_Group')['Unit_Price'].mean().reset_index()
-        if not avg_price_product.empty:
-            fig7 = px.bar(avg_price_product, x='Product_Group', y='Unit_Price',
-                          title='Average Unit Price by Product Group',
-                          labels={'Product_Group': 'Product Group', 'Unit_Price': 'Average Unit Price'},
-                          color='Unit_Price', color_continuous_scale=px.colors.sequential.Greens)
-            st.plotly_chart(fig7, use_container_width=True)
-        else:
-            st.info("No data for Average Unit Price by Product Group.")
-
-    with tab3:
-        st.header("Amount > $1000 Analysis")
-
-        # Chart 8: Sales Above/Below $1000 Distribution
-        st.markdown("### Distribution of Sales by Amount Threshold ($1000)")
-        st.markdown("This pie chart illustrates the proportion of transactions that are above or below the $1000 threshold. It helps HR and stakeholders understand the volume of high-value versus regular transactions.")
-        amount_category_counts = filtered_df['Sale_Over_1000'].value_counts().reset_index()
-        amount_category_counts.columns = ['Category', 'Count']
-        amount_category_counts['Category'] = amount_category_counts['Category'].map({True: 'Sales > $1000', False: 'Sales <= $1000'})
-        if not amount_category_counts.empty:
-            fig8 = px.pie(amount_category_counts, values='Count', names='Category',
-                          title='Number of Sales Transactions Above/Below $1000',
-                          hole=0.3,
-                          labels={'Count': 'Number of Transactions'})
-            st.plotly_chart(fig8, use_container_width=True)
-        else:
-            st.info("No data for Sales Above/Below $1000 Distribution.")
-
-        # Chart 9: Total Revenue from Sales Above/Below $1000
-        st.markdown("### Revenue Contribution by Sales Amount Threshold ($1000)")
-        st.markdown("This bar chart shows the total revenue generated from sales above $1000 compared to sales below or equal to $1000. It highlights the significant financial impact of high-value sales.")
-        revenue_by_category = filtered_df.groupby('Sale_Over_1000')['Final_Line_Amount'].sum().reset_index()
-        revenue_by_category['Sale_Over_1000'] = revenue_by_category['Sale_Over_1000'].map({True: 'Revenue from Sales > $1000', False: 'Revenue from Sales <= $1000'})
-        if not revenue_by_category.empty:
-            fig9 = px.bar(revenue_by_category, x='Sale_Over_1000', y='Final_Line_Amount',
-                          title='Total Revenue from Sales Above/Below $1000',
-                          labels={'Sale_Over_1000': 'Sale Category', 'Final_Line_Amount': 'Total Revenue'},
-                          color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Blues)
-            st.plotly_chart(fig9, use_container_width=True)
-        else:
-            st.info("No data for Revenue Contribution by Sales Amount Threshold.")
-        
-        # Chart 10: Sales > $1000 by Region
-        st.markdown("### High-Value Sales (> $1000) by Region")
-        st.markdown("This chart focuses specifically on high-value transactions and breaks them down by region. This helps identify regions that are strong contributors to premium sales.")
-        high_value_region_sales = filtered_df[filtered_df['Sale_Over_1000']].groupby('Region')['Final_Line_Amount'].sum().reset_index()
-        if not high_value_region_sales.empty:
-            fig10 = px.bar(high_value_region_sales, x='Region', y='Final_Line_Amount',
-                           title='High-Value Sales (> $1000) by Region',
-                           labels={'Region': 'Region', 'Final_Line_Amount': 'Total High-Value Sales'},
-                           color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Oranges)
-            st.plotly_chart(fig10, use_container_width=True)
-        else:
-            st.info("No data for High-Value Sales by Region.")
-
-        # Chart 11: Sales > $1000 by Product Group
-        st.markdown("### High-Value Sales (> $1000) by Product Group")
-        st.markdown("This chart shows which product groups are driving the most high-value sales. This information is critical for product development and marketing strategies.")
-        high_value_product_sales = filtered_df[filtered_df['Sale_Over_1000']].groupby('Product_Group')['Final_Line_Amount'].sum().nlargest(10).reset_index()
-        if not high_value_product_sales.empty:
-            fig11 = px.bar(high_value_product_sales, x='Product_Group', y='Final_Line_Amount',
-                           title='Top 10 Product Group High-Value Sales (> $1000)',
-                           labels={'Product_Group': 'Product Group', 'Final_Line_Amount': 'Total High-Value Sales'},
-                           color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Greys)
-            st.plotly_chart(fig11, use_container_width=True)
-        else:
-            st.info("No data for High-Value Sales by Product Group.")
-
-    with tab4:
-        st.header("Trend Analysis")
-
-        # Chart 12: Monthly Sales Trend
-        st.markdown("### Monthly Sales Trend")
-        st.markdown("This line chart visualizes the total sales amount over months. It helps identify seasonal patterns or overall growth/decline trends in sales performance.")
-        # Ensure 'Posting_Date' is a datetime index for resampling
-        monthly_sales = filtered_df.set_index('Posting_Date').resample('M')['Final_Line_Amount'].sum().reset_index()
-        if not monthly_sales.empty:
-            fig12 = px.line(monthly_sales, x='Posting_Date', y='Final_Line_Amount',
-                            title='Monthly Sales Trend',
-                            labels={'Posting_Date': 'Date', 'Final_Line_Amount': 'Total Sales Amount'})
-            st.plotly_chart(fig12, use_container_width=True)
-        else:
-            st.info("No data for Monthly Sales Trend.")
-
-        # Chart 13: Quarterly Sales Trend
-        st.markdown("### Quarterly Sales Trend")
-        st.markdown("This bar chart displays sales aggregated by quarter. It provides a broader view of sales cycles, which is useful for long-term planning and resource allocation.")
-        quarterly_sales = filtered_df.groupby('Quarter')['Final_Line_Amount'].sum().reset_index()
-        # Ensure correct order for quarters if needed, e.g., using a categorical type
-        quarter_order = ['Q1', 'Q2', 'Q3', 'Q4']
-        quarterly_sales['Quarter'] = pd.Categorical(quarterly_sales['Quarter'], categories=quarter_order, ordered=True)
-        quarterly_sales = quarterly_sales.sort_values('Quarter')
-        
-        if not quarterly_sales.empty:
-            fig13 = px.bar(quarterly_sales, x='Quarter', y='Final_Line_Amount',
-                           title='Quarterly Sales Trend',
-                           labels={'Quarter': 'Quarter', 'Final_Line_Amount': 'Total Sales Amount'},
-                           color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Teal)
-            st.plotly_chart(fig13, use_container_width=True)
-        else:
-            st.info("No data for Quarterly Sales Trend.")
-
-        # Chart 14: Sales by Day of Week
-        st.markdown("### Sales by Day of Week")
-        st.markdown("This chart reveals sales performance across different days of the week, indicating peak selling days or periods of lower activity for operational adjustments.")
-        day_of_week_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        daily_sales = filtered_df.groupby('Day_of_Week')['Final_Line_Amount'].sum().reindex(day_of_week_order).reset_index()
-        if not daily_sales.empty:
-            fig14 = px.bar(daily_sales, x='Day_of_Week', y='Final_Line_Amount',
-                           title='Sales by Day of Week',
-                           labels={'Day_of_Week': 'Day of Week', 'Final_Line_Amount': 'Total Sales Amount'},
-                           color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Magenta)
-            st.plotly_chart(fig14, use_container_width=True)
-        else:
-            st.info("No data for Sales by Day of Week.")
-
-        # Chart 15: Monthly Quantity Sold Trend
-        st.markdown("### Monthly Quantity Sold Trend")
-        st.markdown("Similar to the monthly sales trend, this graph tracks the quantity of items sold each month, helping to understand inventory movement and demand fluctuations.")
-        monthly_qty = filtered_df.set_index('Posting_Date').resample('M')['Quantity'].sum().reset_index()
-        if not monthly_qty.empty:
-            fig15 = px.line(monthly_qty, x='Posting_Date', y='Quantity',
-                            title='Monthly Quantity Sold Trend',
-                            labels={'Posting_Date': 'Date', 'Quantity': 'Total Quantity Sold'})
-            st.plotly_chart(fig15, use_container_width=True)
-        else:
-            st.info("No data for Monthly Quantity Sold Trend.")
-
-    with tab5:
-        st.header("Customer & Product Insights")
-
-        # Chart 16: Sales by Gender
-        st.markdown("### Sales by Gender")
-        st.markdown("This chart breaks down sales figures based on customer gender, which can inform targeted marketing campaigns and product development.")
-        gender_sales = filtered_df.groupby('Gender')['Final_Line_Amount'].sum().reset_index()
-        if not gender_sales.empty:
-            fig16 = px.bar(gender_sales, x='Gender', y='Final_Line_Amount',
-                           title='Sales by Gender',
-                           labels={'Gender': 'Gender', 'Final_Line_Amount': 'Total Sales Amount'},
-                           color='Gender', color_continuous_scale=px.colors.sequential.Portland)
-            st.plotly_chart(fig16, use_container_width=True)
-        else:
-            st.info("No data for Sales by Gender.")
-
-        # Chart 17: Sales by Brand (Top 10)
-        st.markdown("### Top 10 Brands by Sales")
-        st.markdown("This bar chart highlights the brands that contribute the most to total sales revenue, identifying top-performing brands in the portfolio.")
-        brand_sales = filtered_df.groupby('Brand')['Final_Line_Amount'].sum().nlargest(10).reset_index()
-        if not brand_sales.empty:
-            fig17 = px.bar(brand_sales, x='Brand', y='Final_Line_Amount',
-                           title='Top 10 Brands by Sales',
-                           labels={'Brand': 'Brand', 'Final_Line_Amount': 'Total Sales Amount'},
-                           color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Rainbow)
-            st.plotly_chart(fig17, use_container_width=True)
-        else:
-            st.info("No data for Top 10 Brands by Sales.")
-        
-        # Chart 18: Sales by ASM Name (Top 10 Sales Representatives)
-        st.markdown("### Sales Performance by Sales Area Manager (ASM)")
-        st.markdown("This chart displays the sales contribution of each ASM (Area Sales Manager). It's useful for evaluating individual performance and identifying top sales personnel.")
-        asm_sales = filtered_df.groupby('ASM_Name')['Final_Line_Amount'].sum().nlargest(10).reset_index()
-        if not asm_sales.empty:
-            fig18 = px.bar(asm_sales, x='ASM_Name', y='Final_Line_Amount',
-                           title='Top 10 Sales by ASM Name',
-                           labels={'ASM_Name': 'ASM Name', 'Final_Line_Amount': 'Total Sales Amount'},
-                           color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Cividis)
-            st.plotly_chart(fig18, use_container_width=True)
-        else:
-            st.info("No data for Sales Performance by ASM Name.")
-
-        # Chart 19: Sales by Item Category
-        st.markdown("### Sales by Item Category")
-        st.markdown("This visualization shows the distribution of sales across different item categories. It helps in understanding which product types are most popular.")
-        item_category_sales = filtered_df.groupby('Item_Category')['Final_Line_Amount'].sum().reset_index()
-        if not item_category_sales.empty:
-            fig19 = px.bar(item_category_sales, x='Item_Category', y='Final_Line_Amount',
-                           title='Sales by Item Category',
-                           labels={'Item_Category': 'Item Category', 'Final_Line_Amount': 'Total Sales Amount'},
-                           color='Final_Line_Amount', color_continuous_scale=px.colors.sequential.Inferno)
-            st.plotly_chart(fig19, use_container_width=True)
-        else:
-            st.info("No data for Sales by Item Category.")
-
-        # Chart 20: Sales by Online Store (if applicable)
-        if 'Online_Store' in filtered_df.columns and not filtered_df['Online_Store'].isnull().all():
-            st.markdown("### Sales by Online/Offline Store")
-            st.markdown("This chart compares sales generated through online platforms versus offline stores. It helps in evaluating the performance of different sales channels.")
-            online_store_sales = filtered_df.groupby('Online_Store')['Final_Line_Amount'].sum().reset_index()
-            if not online_store_sales.empty:
-                fig20 = px.pie(online_store_sales, values='Final_Line_Amount', names='Online_Store',
-                               title='Sales by Online/Offline Store',
-                               labels={'Final_Line_Amount': 'Total Sales Amount'},
-                               hole=0.3)
-                st.plotly_chart(fig20, use_container_width=True)
-            else:
-                st.info("No data for Sales by Online/Offline Store.")
-        else:
-            st.info("Online_Store data not available or all null for visualization.")
+    # Compute every chart aggregate once, cached on the filter selection
+    agg = compute_aggregates(
+        filtered_df, date_range,
+        tuple(selected_regions), tuple(selected_product_groups),
+        tuple(selected_sales_channels), amount_range
+    )
 
-    with tab6:
-        st.header("Detailed Data View")
-        st.markdown("This table provides a raw view of the filtered sales data, allowing for detailed inspection of individual transactions. You can sort and search within this table.")
-        st.dataframe(filtered_df) 
+    # Streamlit reruns the whole script on every interaction; a radio
+    # selector with one render call per view means only the visible page
+    # pays its figure-build cost instead of all six tabs every rerun
+    view = st.radio(
+        "View",
+        ["Overview", "Sales Analysis", "Amount > 1000 Analysis", "Trend Analysis", "Customer & Product Insights", "Detailed Data"],
+        horizontal=True, label_visibility='collapsed'
+    )
+    if view == "Overview":
+        render_overview(agg)
+    elif view == "Sales Analysis":
+        render_sales_analysis(agg)
+    elif view == "Amount > 1000 Analysis":
+        render_amount_analysis(agg)
+    elif view == "Trend Analysis":
+        render_trend_analysis(agg)
+    elif view == "Customer & Product Insights":
+        render_customer_product_insights(agg)
+    else:
+        # The CSV payload is only serialized when the data view is open
+        render_detailed_data(filtered_df, csv_bytes(
+            filtered_df, date_range,
+            tuple(selected_regions), tuple(selected_product_groups),
+            tuple(selected_sales_channels), amount_range
+        ))